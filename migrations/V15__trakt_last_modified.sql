@@ -0,0 +1,3 @@
+ALTER TABLE trakt_watchlist ADD COLUMN last_modified TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now();
+ALTER TABLE trakt_watched_episodes ADD COLUMN last_modified TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now();
+ALTER TABLE trakt_watched_movies ADD COLUMN last_modified TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now();
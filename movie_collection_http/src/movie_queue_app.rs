@@ -47,8 +47,8 @@ pub async fn start_app() -> Result<(), Error> {
     async fn _update_db(pool: PgPool) {
         let mut i = interval(Duration::from_secs(60));
         loop {
-            fill_from_db(&pool).await.unwrap_or(());
             i.tick().await;
+            fill_from_db(&pool).await.unwrap_or(());
         }
     }
     TRIGGER_DB_UPDATE.set();
@@ -65,6 +65,7 @@ pub async fn start_app() -> Result<(), Error> {
 
     let pool = PgPool::new(&config.pgurl);
     let trakt = TraktConnection::new(config.clone());
+    trakt.init().await;
 
     tokio::task::spawn(_update_db(pool.clone()));
 
@@ -1,4 +1,5 @@
 use anyhow::format_err;
+use futures::future::try_join_all;
 use rweb::Schema;
 use serde::{Deserialize, Serialize};
 use stack_string::StackString;
@@ -119,7 +120,12 @@ impl WatchlistActionRequest {
         match self.action {
             TraktActions::Add => {
                 trakt.init().await;
-                if let Some(show) = trakt.get_watchlist_shows().await?.get(&self.imdb_url) {
+                if let Some(result) = trakt.get_show_by_imdb_id(&self.imdb_url).await?.pop() {
+                    let show = WatchListShow {
+                        link: self.imdb_url.clone(),
+                        title: result.show.title,
+                        year: result.show.year,
+                    };
                     show.insert_show(&pool).await?;
                 }
             }
@@ -306,11 +312,16 @@ pub struct ImdbEpisodesUpdateRequest {
 
 impl ImdbEpisodesUpdateRequest {
     pub async fn handle(&self, pool: &PgPool) -> Result<(), Error> {
-        for episode in &self.episodes {
-            match episode.get_index(&pool).await? {
-                Some(_) => episode.update_episode(&pool).await?,
-                None => episode.insert_episode(&pool).await?,
-            }
+        for chunk in self.episodes.chunks(10) {
+            let futures = chunk.iter().map(|episode| async move {
+                match episode.get_index(&pool).await? {
+                    Some(_) => episode.update_episode(&pool).await?,
+                    None => episode.insert_episode(&pool).await?,
+                }
+                Ok(())
+            });
+            let results: Result<Vec<()>, Error> = try_join_all(futures).await;
+            results?;
         }
         Ok(())
     }
@@ -323,11 +334,16 @@ pub struct ImdbRatingsUpdateRequest {
 
 impl ImdbRatingsUpdateRequest {
     pub async fn handle(&self, pool: &PgPool) -> Result<(), Error> {
-        for show in &self.shows {
-            match ImdbRatings::get_show_by_link(show.link.as_ref(), &pool).await? {
-                Some(_) => show.update_show(&pool).await?,
-                None => show.insert_show(&pool).await?,
-            }
+        for chunk in self.shows.chunks(10) {
+            let futures = chunk.iter().map(|show| async move {
+                match ImdbRatings::get_show_by_link(show.link.as_ref(), &pool).await? {
+                    Some(_) => show.update_show(&pool).await?,
+                    None => show.insert_show(&pool).await?,
+                }
+                Ok(())
+            });
+            let results: Result<Vec<()>, Error> = try_join_all(futures).await;
+            results?;
         }
         Ok(())
     }
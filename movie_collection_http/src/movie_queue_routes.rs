@@ -1082,7 +1082,7 @@ pub async fn trakt_cal(
     #[cookie = "jwt"] _: LoggedUser,
     #[data] state: AppState,
 ) -> WarpResult<TraktCalendarResponse> {
-    let entries = trakt_cal_http_worker(&state.trakt, &state.db).await?;
+    let entries = trakt_cal_http_worker(&state.trakt, &state.db, &state.config).await?;
     let body: String = trakt_cal_worker(&entries).into();
     Ok(HtmlBase::new(body).into())
 }
@@ -1157,20 +1157,22 @@ pub async fn refresh_auth(
 async fn trakt_cal_http_worker(
     trakt: &TraktConnection,
     pool: &PgPool,
+    config: &Config,
 ) -> Result<Vec<StackString>, Error> {
-    let button_add = Arc::new(format!(
-        "{}{}",
-        r#"<td><button type="submit" id="ID" "#,
-        r#"onclick="imdb_update('SHOW', 'LINK', SEASON, '/trakt/cal');"
-            >update database</button></td>"#
-    ));
+    let button_add = r#"<td><button type="submit" id="ID" onclick="imdb_update('SHOW', 'LINK', SEASON, '/trakt/cal');"
+            >update database</button></td>"#;
+    let mock_stdout = MockStdout::new();
+    let stdout = StdoutChannel::with_mock_stdout(mock_stdout.clone(), mock_stdout.clone());
+
+    let mc = MovieCollection::new(config, pool, &stdout);
     trakt.init().await;
     let cal_list = trakt.get_calendar().await?;
+    let show_map = mc.get_imdb_show_map().await?;
 
     let mut lines = Vec::new();
     for cal in cal_list {
-        let show = match ImdbRatings::get_show_by_link(&cal.link, &pool).await? {
-            Some(s) => s.show,
+        let show = match show_map.get(&cal.link) {
+            Some(s) => s.show.clone(),
             None => "".into(),
         };
         let exists = if show.is_empty() {
@@ -1236,16 +1238,8 @@ pub async fn watch_list_http_worker(
     imdb_url: &str,
     season: i32,
 ) -> HttpResult<StackString> {
-    let button_add = format!(
-        "{}{}",
-        r#"<button type="submit" id="ID" "#,
-        r#"onclick="watched_add('SHOW', SEASON, EPISODE);">add to watched</button>"#
-    );
-    let button_rm = format!(
-        "{}{}",
-        r#"<button type="submit" id="ID" "#,
-        r#"onclick="watched_rm('SHOW', SEASON, EPISODE);">remove from watched</button>"#
-    );
+    let button_add = r#"<button type="submit" id="ID" onclick="watched_add('SHOW', SEASON, EPISODE);">add to watched</button>"#;
+    let button_rm = r#"<button type="submit" id="ID" onclick="watched_rm('SHOW', SEASON, EPISODE);">remove from watched</button>"#;
 
     let mc = MovieCollection::new(config, pool, stdout);
     let mq = MovieQueueDB::new(config, pool, stdout);
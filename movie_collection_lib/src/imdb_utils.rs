@@ -1,6 +1,7 @@
 use anyhow::Error;
 use chrono::NaiveDate;
 use futures::future::try_join_all;
+use lazy_static::lazy_static;
 use log::debug;
 use reqwest::{Client, Url};
 use select::{
@@ -9,11 +10,23 @@ use select::{
 };
 use serde::Deserialize;
 use stack_string::StackString;
-use std::fmt;
+use std::{
+    collections::HashMap,
+    fmt,
+    time::{Duration, Instant},
+};
+use tokio::sync::RwLock;
 
 use crate::utils::{option_string_wrapper, ExponentialRetry};
 
-#[derive(Default, Debug)]
+const PARSE_IMDB_CACHE_TTL: Duration = Duration::from_secs(24 * 3600);
+
+lazy_static! {
+    static ref PARSE_IMDB_CACHE: RwLock<HashMap<StackString, (Instant, Vec<ImdbTuple>)>> =
+        RwLock::new(HashMap::new());
+}
+
+#[derive(Default, Debug, Clone)]
 pub struct ImdbTuple {
     pub title: StackString,
     pub link: StackString,
@@ -84,6 +97,11 @@ impl ImdbConnection {
     }
 
     pub async fn parse_imdb(&self, title: &str) -> Result<Vec<ImdbTuple>, Error> {
+        if let Some((timestamp, results)) = PARSE_IMDB_CACHE.read().await.get(title) {
+            if timestamp.elapsed() < PARSE_IMDB_CACHE_TTL {
+                return Ok(results.clone());
+            }
+        }
         let endpoint = "http://www.imdb.com/find?";
         let url = Url::parse_with_params(endpoint, &[("s", "all"), ("q", title)])?;
         let body = self.get(&url).await?.text().await?;
@@ -115,7 +133,12 @@ impl ImdbConnection {
                 rating: r.rating.unwrap_or(-1.0),
             })
         });
-        try_join_all(futures).await
+        let results = try_join_all(futures).await?;
+        PARSE_IMDB_CACHE
+            .write()
+            .await
+            .insert(title.into(), (Instant::now(), results.clone()));
+        Ok(results)
     }
 
     pub async fn parse_imdb_rating(&self, title: &str) -> Result<RatingOutput, Error> {
@@ -521,8 +521,8 @@ impl MovieCollection {
             .await?
             .iter()
             .map(|row| {
-                let path: StackString = row.try_get("path")?;
-                let idx: i32 = row.try_get("idx")?;
+                let path: StackString = row.try_get(0)?;
+                let idx: i32 = row.try_get(1)?;
                 Ok((path, idx))
             })
             .collect();
@@ -537,8 +537,8 @@ impl MovieCollection {
             .await?
             .iter()
             .map(|row| {
-                let path: StackString = row.try_get("path")?;
-                let show: StackString = row.try_get("show")?;
+                let path: StackString = row.try_get(0)?;
+                let show: StackString = row.try_get(1)?;
                 Ok((path, show))
             })
             .collect();
@@ -553,9 +553,9 @@ impl MovieCollection {
             .await?
             .iter()
             .map(|row| {
-                let show: StackString = row.try_get("show")?;
-                let season: i32 = row.try_get("season")?;
-                let episode: i32 = row.try_get("episode")?;
+                let show: StackString = row.try_get(0)?;
+                let season: i32 = row.try_get(1)?;
+                let episode: i32 = row.try_get(2)?;
                 Ok((show, season, episode))
             })
             .collect();
@@ -923,6 +923,9 @@ impl LastModifiedResponse {
             "movie_collection",
             "movie_queue",
             "plex_event",
+            "trakt_watchlist",
+            "trakt_watched_episodes",
+            "trakt_watched_movies",
         ];
 
         let futures = tables.into_iter().map(|table| async move {
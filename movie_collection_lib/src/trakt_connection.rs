@@ -11,12 +11,12 @@ use smallvec::SmallVec;
 use stack_string::StackString;
 use std::{
     collections::{HashMap, HashSet},
-    path::PathBuf,
-    sync::Arc,
+    path::{Path, PathBuf},
+    sync::{Arc, Mutex},
 };
 use tokio::{
-    fs::{read, write},
-    sync::{Mutex, RwLock},
+    fs::{read, rename, write},
+    sync::RwLock,
 };
 
 use crate::{
@@ -30,6 +30,10 @@ use crate::{
 lazy_static! {
     static ref CSRF_TOKEN: Mutex<Option<StackString>> = Mutex::new(None);
     static ref AUTH_TOKEN: RwLock<Option<Arc<AccessTokenResponse>>> = RwLock::new(None);
+    static ref TOKEN_PATH: Option<PathBuf> =
+        dirs::home_dir().map(|d| d.join(".trakt").join("auth_token_web.json"));
+    static ref RW_HEADERS: RwLock<Option<(Arc<AccessTokenResponse>, HeaderMap)>> =
+        RwLock::new(None);
 }
 
 #[derive(Clone)]
@@ -54,6 +58,9 @@ impl TraktConnection {
     }
 
     pub async fn init(&self) {
+        if AUTH_TOKEN.read().await.is_some() {
+            return;
+        }
         if let Ok(auth_token) = self.read_auth_token().await {
             AUTH_TOKEN.write().await.replace(Arc::new(auth_token));
         } else {
@@ -61,9 +68,10 @@ impl TraktConnection {
         }
     }
 
-    fn token_path() -> Result<PathBuf, Error> {
-        let home_dir = dirs::home_dir().ok_or_else(|| format_err!("No home dir"))?;
-        Ok(home_dir.join(".trakt").join("auth_token_web.json"))
+    fn token_path() -> Result<&'static Path, Error> {
+        TOKEN_PATH
+            .as_deref()
+            .ok_or_else(|| format_err!("No home dir"))
     }
 
     async fn read_auth_token(&self) -> Result<AccessTokenResponse, Error> {
@@ -71,9 +79,10 @@ impl TraktConnection {
     }
 
     async fn write_auth_token(&self, token: &AccessTokenResponse) -> Result<(), Error> {
-        write(&Self::token_path()?, &serde_json::to_string(token)?)
-            .await
-            .map_err(Into::into)
+        let path = Self::token_path()?;
+        let tmp_path = path.with_extension("json.new");
+        write(&tmp_path, &serde_json::to_vec(token)?).await?;
+        rename(&tmp_path, path).await.map_err(Into::into)
     }
 
     fn get_random_string() -> String {
@@ -95,12 +104,15 @@ impl TraktConnection {
     pub async fn get_auth_url(&self) -> Result<Url, Error> {
         let state = Self::get_random_string();
         let url = self._get_auth_url(&state)?;
-        CSRF_TOKEN.lock().await.replace(state.into());
+        CSRF_TOKEN
+            .lock()
+            .expect("CSRF_TOKEN lock poisoned")
+            .replace(state.into());
         Ok(url)
     }
 
     async fn get_auth_token(&self, code: &str, state: &str) -> Result<AccessTokenResponse, Error> {
-        let current_state = CSRF_TOKEN.lock().await.take();
+        let current_state = CSRF_TOKEN.lock().expect("CSRF_TOKEN lock poisoned").take();
         if let Some(current_state) = current_state {
             if state != current_state.as_str() {
                 return Err(format_err!("Incorrect state"));
@@ -183,14 +195,23 @@ impl TraktConnection {
     }
 
     async fn get_rw_headers(&self) -> Result<HeaderMap, Error> {
-        let mut headers = self.get_ro_headers()?;
         let auth_token = AUTH_TOKEN
             .read()
             .await
             .clone()
             .ok_or_else(|| format_err!("No auth token"))?;
+        if let Some((token, headers)) = RW_HEADERS.read().await.as_ref() {
+            if Arc::ptr_eq(token, &auth_token) {
+                return Ok(headers.clone());
+            }
+        }
+        let mut headers = self.get_ro_headers()?;
         let bearer = format!("Bearer {}", auth_token.access_token);
         headers.insert("Authorization", bearer.parse()?);
+        RW_HEADERS
+            .write()
+            .await
+            .replace((auth_token, headers.clone()));
         Ok(headers)
     }
 
@@ -221,15 +242,20 @@ impl TraktConnection {
     }
 
     pub async fn get_watchlist_shows(&self) -> Result<HashMap<StackString, WatchListShow>, Error> {
+        let limit = 100;
         let mut current_page = 1;
         let mut results = Vec::new();
         loop {
-            let page = self.get_watchlist_shows_page(current_page, 20).await?;
+            let page = self.get_watchlist_shows_page(current_page, limit).await?;
             current_page += 1;
             if page.is_empty() {
                 break;
             }
-            results.extend_from_slice(&page);
+            let last_page = page.len() < limit;
+            results.extend(page);
+            if last_page {
+                break;
+            }
         }
         let watchlist = results
             .into_iter()
@@ -313,18 +339,18 @@ impl TraktConnection {
             .map_err(Into::into)
     }
 
-    pub async fn add_watchlist_show(&self, imdb_id: &str) -> Result<TraktResult, Error> {
-        let show_obj = self
-            .get_show_by_imdb_id(imdb_id)
-            .await?
-            .pop()
-            .ok_or_else(|| format_err!("No show returned"))?;
+    async fn post_sync_items<T: Serialize>(
+        &self,
+        path: &str,
+        key: &str,
+        items: Vec<T>,
+    ) -> Result<TraktResult, Error> {
         let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/watchlist", self.config.trakt_endpoint);
+        let url = format!("{}/{}", self.config.trakt_endpoint, path);
         let data = hashmap! {
-            "shows" => vec![show_obj.show],
+            key => items,
         };
-        debug!("shows: {}", serde_json::to_string_pretty(&data)?);
+        debug!("{}: {}", key, serde_json::to_string_pretty(&data)?);
         let text = self
             .client
             .post(url.as_str())
@@ -340,30 +366,24 @@ impl TraktConnection {
         })
     }
 
-    pub async fn remove_watchlist_show(&self, imdb_id: &str) -> Result<TraktResult, Error> {
+    pub async fn add_watchlist_show(&self, imdb_id: &str) -> Result<TraktResult, Error> {
         let show_obj = self
             .get_show_by_imdb_id(imdb_id)
             .await?
             .pop()
             .ok_or_else(|| format_err!("No show returned"))?;
-        let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/watchlist/remove", self.config.trakt_endpoint);
-        let data = hashmap! {
-            "shows" => vec![show_obj.show],
-        };
-        let text = self
-            .client
-            .post(url.as_str())
-            .headers(headers)
-            .json(&data)
-            .send()
+        self.post_sync_items("sync/watchlist", "shows", vec![show_obj.show])
+            .await
+    }
+
+    pub async fn remove_watchlist_show(&self, imdb_id: &str) -> Result<TraktResult, Error> {
+        let show_obj = self
+            .get_show_by_imdb_id(imdb_id)
             .await?
-            .error_for_status()?
-            .text()
-            .await?;
-        Ok(TraktResult {
-            status: text.into(),
-        })
+            .pop()
+            .ok_or_else(|| format_err!("No show returned"))?;
+        self.post_sync_items("sync/watchlist/remove", "shows", vec![show_obj.show])
+            .await
     }
 
     pub async fn get_watched_shows(
@@ -381,38 +401,32 @@ impl TraktConnection {
             .json()
             .await?;
 
-        #[allow(clippy::manual_filter_map)]
-        let episode_map = watched_episodes
-            .into_iter()
-            .filter(|show_entry| show_entry.show.ids.imdb.is_some())
-            .flat_map(|show_entry| {
-                let title = show_entry.show.title.clone();
-                let imdb_url: StackString = show_entry
-                    .show
-                    .ids
-                    .imdb
-                    .as_ref()
-                    .map_or_else(|| "".into(), Clone::clone);
-                show_entry
-                    .seasons
-                    .into_iter()
-                    .flat_map(move |season_entry| {
-                        let season = season_entry.number;
-                        let title = title.clone();
-                        let imdb_url = imdb_url.clone();
-                        season_entry.episodes.into_iter().map(move |episode_entry| {
-                            let episode = episode_entry.number;
-                            let epi = WatchedEpisode {
-                                title: title.clone(),
-                                imdb_url: imdb_url.clone(),
-                                episode,
-                                season,
-                            };
-                            ((imdb_url.clone(), season, episode), epi)
-                        })
-                    })
-            })
-            .collect();
+        let capacity = watched_episodes
+            .iter()
+            .flat_map(|show_entry| show_entry.seasons.iter())
+            .map(|season_entry| season_entry.episodes.len())
+            .sum();
+        let mut episode_map = HashMap::with_capacity(capacity);
+        for show_entry in watched_episodes {
+            let imdb_url: StackString = match show_entry.show.ids.imdb {
+                Some(imdb) => imdb,
+                None => continue,
+            };
+            let title = show_entry.show.title;
+            for season_entry in show_entry.seasons {
+                let season = season_entry.number;
+                for episode_entry in season_entry.episodes {
+                    let episode = episode_entry.number;
+                    let epi = WatchedEpisode {
+                        title: title.clone(),
+                        imdb_url: imdb_url.clone(),
+                        episode,
+                        season,
+                    };
+                    episode_map.insert((imdb_url.clone(), season, episode), epi);
+                }
+            }
+        }
         Ok(episode_map)
     }
 
@@ -482,26 +496,12 @@ impl TraktConnection {
         episode: i32,
     ) -> Result<TraktResult, Error> {
         let episode_obj = self.get_episode(imdb_id, season, episode).await?;
-        let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/history", self.config.trakt_endpoint);
-        let data = hashmap! {
-            "episodes" => vec![
-                WatchedEpisodeRequest {
-                    watched_at: Utc::now(),
-                    ids: episode_obj.ids,
-                }
-            ]
+        let request = WatchedEpisodeRequest {
+            watched_at: Utc::now(),
+            ids: episode_obj.ids,
         };
-        self.client
-            .post(url.as_str())
-            .headers(headers)
-            .json(&data)
-            .send()
-            .await?
-            .error_for_status()?;
-        Ok(TraktResult {
-            status: "success".into(),
-        })
+        self.post_sync_items("sync/history", "episodes", vec![request])
+            .await
     }
 
     pub async fn add_movie_to_watched(&self, imdb_id: &str) -> Result<TraktResult, Error> {
@@ -510,28 +510,14 @@ impl TraktConnection {
             .await?
             .pop()
             .ok_or_else(|| format_err!("No show returned"))?;
-        let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/history", self.config.trakt_endpoint);
-        let data = hashmap! {
-            "movies" => vec![
-                WatchedMovieRequest {
-                    watched_at: Utc::now(),
-                    title: movie_obj.movie.title.clone(),
-                    year: movie_obj.movie.year,
-                    ids: movie_obj.movie.ids,
-                }
-            ]
+        let request = WatchedMovieRequest {
+            watched_at: Utc::now(),
+            title: movie_obj.movie.title.clone(),
+            year: movie_obj.movie.year,
+            ids: movie_obj.movie.ids,
         };
-        self.client
-            .post(url.as_str())
-            .headers(headers)
-            .json(&data)
-            .send()
-            .await?
-            .error_for_status()?;
-        Ok(TraktResult {
-            status: "success".into(),
-        })
+        self.post_sync_items("sync/history", "movies", vec![request])
+            .await
     }
 
     pub async fn remove_episode_to_watched(
@@ -541,26 +527,12 @@ impl TraktConnection {
         episode: i32,
     ) -> Result<TraktResult, Error> {
         let episode_obj = self.get_episode(imdb_id, season, episode).await?;
-        let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/history/remove", self.config.trakt_endpoint);
-        let data = hashmap! {
-            "episodes" => vec![
-                WatchedEpisodeRequest {
-                    watched_at: Utc::now(),
-                    ids: episode_obj.ids,
-                }
-            ]
+        let request = WatchedEpisodeRequest {
+            watched_at: Utc::now(),
+            ids: episode_obj.ids,
         };
-        self.client
-            .post(url.as_str())
-            .headers(headers)
-            .json(&data)
-            .send()
-            .await?
-            .error_for_status()?;
-        Ok(TraktResult {
-            status: "success".into(),
-        })
+        self.post_sync_items("sync/history/remove", "episodes", vec![request])
+            .await
     }
 
     pub async fn remove_movie_to_watched(&self, imdb_id: &str) -> Result<TraktResult, Error> {
@@ -569,28 +541,14 @@ impl TraktConnection {
             .await?
             .pop()
             .ok_or_else(|| format_err!("No show returned"))?;
-        let headers = self.get_rw_headers().await?;
-        let url = format!("{}/sync/history/remove", self.config.trakt_endpoint);
-        let data = hashmap! {
-            "movies" => vec![
-                WatchedMovieRequest {
-                    watched_at: Utc::now(),
-                    title: movie_obj.movie.title.clone(),
-                    year: movie_obj.movie.year,
-                    ids: movie_obj.movie.ids,
-                }
-            ]
+        let request = WatchedMovieRequest {
+            watched_at: Utc::now(),
+            title: movie_obj.movie.title.clone(),
+            year: movie_obj.movie.year,
+            ids: movie_obj.movie.ids,
         };
-        self.client
-            .post(url.as_str())
-            .headers(headers)
-            .json(&data)
-            .send()
-            .await?
-            .error_for_status()?;
-        Ok(TraktResult {
-            status: "success".into(),
-        })
+        self.post_sync_items("sync/history/remove", "movies", vec![request])
+            .await
     }
 }
 
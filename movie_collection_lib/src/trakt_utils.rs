@@ -1,6 +1,6 @@
 use anyhow::Error;
 use chrono::NaiveDate;
-use futures::future::try_join_all;
+use futures::{future::try_join_all, try_join};
 use itertools::Itertools;
 use log::debug;
 use postgres_query::{query, query_dyn, FromSqlRow};
@@ -13,13 +13,12 @@ use std::{
     fmt,
     hash::{Hash, Hasher},
     str::FromStr,
-    sync::Arc,
 };
 use stdout_channel::StdoutChannel;
 
 use crate::{
-    config::Config, imdb_episodes::ImdbEpisodes, imdb_ratings::ImdbRatings,
-    movie_collection::MovieCollection, pgpool::PgPool, trakt_connection::TraktConnection,
+    config::Config, imdb_episodes::ImdbEpisodes, movie_collection::MovieCollection, pgpool::PgPool,
+    trakt_connection::TraktConnection,
 };
 
 use crate::{tv_show_source::TvShowSource, utils::option_string_wrapper};
@@ -486,83 +485,75 @@ pub async fn sync_trakt_with_db(
     trakt: &TraktConnection,
     mc: &MovieCollection,
 ) -> Result<(), Error> {
-    let watchlist_shows_db = Arc::new(get_watchlist_shows_db(&mc.pool).await?);
     trakt.init().await;
-    let watchlist_shows = trakt.get_watchlist_shows().await?;
+    let (watchlist_shows_db, watchlist_shows) = try_join!(
+        get_watchlist_shows_db(&mc.pool),
+        trakt.get_watchlist_shows()
+    )?;
     if watchlist_shows.is_empty() {
         return Ok(());
     }
 
-    let futures = watchlist_shows.into_iter().map(|(link, show)| {
-        let watchlist_shows_db = watchlist_shows_db.clone();
-        async move {
-            if !watchlist_shows_db.contains(link.as_str()) {
-                show.insert_show(&mc.pool).await?;
-                mc.stdout.send(format!("insert watchlist {}", show));
-            }
+    let futures = watchlist_shows
+        .into_iter()
+        .filter(|(link, _)| !watchlist_shows_db.contains(link.as_str()))
+        .map(|(_, show)| async move {
+            show.insert_show(&mc.pool).await?;
+            mc.stdout.send(format!("insert watchlist {}", show));
             Ok(())
-        }
-    });
+        });
     let results: Result<Vec<_>, Error> = try_join_all(futures).await;
     results?;
 
-    let watched_shows_db: HashMap<(StackString, i32, i32), _> =
-        get_watched_shows_db(&mc.pool, "", None)
-            .await?
-            .into_iter()
-            .map(|s| ((s.imdb_url.clone(), s.season, s.episode), s))
-            .collect();
-    let watched_shows_db = Arc::new(watched_shows_db);
-    let watched_shows = trakt.get_watched_shows().await?;
+    let (watched_shows_db, watched_shows) = try_join!(
+        get_watched_shows_db(&mc.pool, "", None),
+        trakt.get_watched_shows()
+    )?;
+    let watched_shows_db: HashMap<(StackString, i32, i32), _> = watched_shows_db
+        .into_iter()
+        .map(|s| ((s.imdb_url.clone(), s.season, s.episode), s))
+        .collect();
     if watched_shows.is_empty() {
         return Ok(());
     }
-    let futures = watched_shows.into_iter().map(|(key, episode)| {
-        let watched_shows_db = watched_shows_db.clone();
-        async move {
-            if !watched_shows_db.contains_key(&key) {
-                episode.insert_episode(&mc.pool).await?;
-                mc.stdout
-                    .send(format!("insert watched episode {}", episode));
-            }
+    let futures = watched_shows
+        .into_iter()
+        .filter(|(key, _)| !watched_shows_db.contains_key(key))
+        .map(|(_, episode)| async move {
+            episode.insert_episode(&mc.pool).await?;
+            mc.stdout
+                .send(format!("insert watched episode {}", episode));
             Ok(())
-        }
-    });
+        });
     let results: Result<Vec<_>, Error> = try_join_all(futures).await;
     results?;
 
-    let watched_movies_db: HashSet<_> =
-        get_watched_movies_db(&mc.pool).await?.into_iter().collect();
-    let watched_movies_db = Arc::new(watched_movies_db);
-    let watched_movies = trakt.get_watched_movies().await?;
-    let watched_movies = Arc::new(watched_movies);
+    let (watched_movies_db, watched_movies) =
+        try_join!(get_watched_movies_db(&mc.pool), trakt.get_watched_movies())?;
+    let watched_movies_db: HashSet<_> = watched_movies_db.into_iter().collect();
     if watched_movies.is_empty() {
         return Ok(());
     }
 
-    let futures = watched_movies.iter().map(|movie: &WatchedMovie| {
-        let watched_movies_db = watched_movies_db.clone();
-        async move {
-            if !watched_movies_db.contains(movie.imdb_url.as_str()) {
-                movie.insert_movie(&mc.pool).await?;
-                mc.stdout.send(format!("insert watched movie {}", movie));
-            }
+    let futures = watched_movies
+        .iter()
+        .filter(|movie| !watched_movies_db.contains(movie.imdb_url.as_str()))
+        .map(|movie: &WatchedMovie| async move {
+            movie.insert_movie(&mc.pool).await?;
+            mc.stdout.send(format!("insert watched movie {}", movie));
             Ok(())
-        }
-    });
+        });
     let results: Result<Vec<_>, Error> = try_join_all(futures).await;
     results?;
 
-    let futures = watched_movies_db.iter().map(|movie| {
-        let watched_movies = watched_movies.clone();
-        async move {
-            if !watched_movies.contains(movie.imdb_url.as_str()) {
-                movie.delete_movie(&mc.pool).await?;
-                mc.stdout.send(format!("delete watched {}", movie));
-            }
+    let futures = watched_movies_db
+        .iter()
+        .filter(|movie| !watched_movies.contains(movie.imdb_url.as_str()))
+        .map(|movie| async move {
+            movie.delete_movie(&mc.pool).await?;
+            mc.stdout.send(format!("delete watched {}", movie));
             Ok(())
-        }
-    });
+        });
     let results: Result<Vec<_>, Error> = try_join_all(futures).await;
     results?;
     Ok(())
@@ -590,10 +581,10 @@ async fn get_imdb_url_from_show(
 
 async fn trakt_cal_list(trakt: &TraktConnection, mc: &MovieCollection) -> Result<(), Error> {
     trakt.init().await;
-    let cal_entries = trakt.get_calendar().await?;
+    let (cal_entries, show_map) = try_join!(trakt.get_calendar(), mc.get_imdb_show_map())?;
     for cal in cal_entries {
-        let show = match ImdbRatings::get_show_by_link(&cal.link, &mc.pool).await? {
-            Some(s) => s.show,
+        let show = match show_map.get(&cal.link) {
+            Some(s) => s.show.clone(),
             None => "".into(),
         };
         let exists = if show.is_empty() {
@@ -629,7 +620,12 @@ async fn watchlist_add(
             trakt.add_watchlist_show(&imdb_url_).await?
         ));
         debug!("GOT HERE");
-        if let Some(show) = trakt.get_watchlist_shows().await?.get(imdb_url.as_str()) {
+        if let Some(result) = trakt.get_show_by_imdb_id(&imdb_url).await?.pop() {
+            let show = WatchListShow {
+                link: imdb_url,
+                title: result.show.title,
+                year: result.show.year,
+            };
             debug!("INSERT SHOW {}", show);
             show.insert_show(&mc.pool).await?;
         }
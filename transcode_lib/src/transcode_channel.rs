@@ -1,5 +1,5 @@
 use anyhow::{format_err, Error};
-use deadpool_lapin::Config as LapinConfig;
+use deadpool_lapin::{Config as LapinConfig, Pool};
 use derive_more::{Deref, DerefMut};
 use futures::StreamExt;
 use lapin::{
@@ -10,18 +10,21 @@ use lapin::{
     types::FieldTable,
     BasicProperties, Channel, Queue,
 };
+use lazy_static::lazy_static;
 use log::{debug, error};
 use serde::de::DeserializeOwned;
 use std::future::Future;
 
+lazy_static! {
+    static ref LAPIN_POOL: Pool = LapinConfig::default().create_pool();
+}
+
 #[derive(Clone, Deref, DerefMut)]
 pub struct TranscodeChannel(Channel);
 
 impl TranscodeChannel {
     pub async fn open_channel() -> Result<Self, Error> {
-        let cfg = LapinConfig::default();
-        let pool = cfg.create_pool();
-        let conn = pool.get().await?;
+        let conn = LAPIN_POOL.get().await?;
         conn.create_channel().await.map_err(Into::into).map(Self)
     }
 